@@ -4,7 +4,7 @@ Find the fastest way from start to end.
 
 import random
 import arcade
-import copy
+from sprite_pool import SpritePool
 
 class FindFastestWay(arcade.Window):
     """ Our custom Window Class"""
@@ -14,8 +14,12 @@ class FindFastestWay(arcade.Window):
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        self.initial_obstacles = []  # obstacles on init (useful for restart)
-        self.obstacles = arcade.SpriteList()  # active/visible obstacles
+        self.initial_obstacles = []  # obstacle positions on init (useful for restart)
+        self.obstacles = arcade.SpriteList()  # all obstacle sprites, removed ones are hidden
+        self.obstacle_pool = SpritePool(
+            self.obstacles,
+            lambda: arcade.Sprite(":resources:images/tiles/boxCrate_double.png"),
+        )
 
         self.goal = arcade.Sprite(":resources:images/enemies/slimeGreen.png")
         self.goal.center_x = 0.9 * screen_width
@@ -35,28 +39,30 @@ class FindFastestWay(arcade.Window):
         self.number_of_obstacles_removed = 0
         self.player.position = (0, 0)
         if new_obstacles:
-            for sprite in self.obstacles:
-                sprite.remove_from_sprite_lists()
             self._create_obstacles()
         self._set_obstacles_to_initial_obstacles()
 
     def _create_obstacles(self, number_of_obstacles: int = 17):
         self.initial_obstacles = []
         for i in range(number_of_obstacles):
-            obstacle = arcade.Sprite(":resources:images/tiles/boxCrate_double.png")
-            obstacle.center_x = random.random() * self.screen_width
-            obstacle.center_y = random.random() * self.screen_height
-            # Note: Unless https://github.com/pythonarcade/arcade/issues/752 is
-            # resolved, do not scale by setting width or height of the sprites
-            self.initial_obstacles.append(obstacle)
+            position = (random.random() * self.screen_width, random.random() * self.screen_height)
+            self.initial_obstacles.append(position)
 
     def _set_obstacles_to_initial_obstacles(self):
-        self.obstacles = arcade.SpriteList()
-        for obstacle in self.initial_obstacles:
-            self.obstacles.append(copy.deepcopy(obstacle))
+        # reuse the sprites of the last game instead of creating new ones
+        self.obstacle_pool.release_all()
+        for position in self.initial_obstacles:
+            obstacle = self.obstacle_pool.acquire()
+            obstacle.position = position
+            obstacle.angle = 0
+            obstacle.change_x = 0
+            obstacle.change_y = 0
+            obstacle.change_angle = 0
+            # Note: Unless https://github.com/pythonarcade/arcade/issues/752 is
+            # resolved, do not scale by setting width or height of the sprites
 
     def _increase_speed_of_obstacles(self):
-        for obstacle in self.obstacles:
+        for obstacle in self.obstacle_pool.in_use:
             if obstacle.change_x == 0:
                 obstacle.change_angle = 0.2 * random.random()
                 obstacle.change_x = 0.6 * random.random()
@@ -68,10 +74,10 @@ class FindFastestWay(arcade.Window):
 
 
     def remove_obstacles_around_player(self, max_distance=200):
-        for obstacle in self.obstacles:
+        for obstacle in self.obstacle_pool.in_use:
             distance = arcade.get_distance_between_sprites(self.player, obstacle)
             if distance < max_distance:
-                obstacle.remove_from_sprite_lists()
+                self.obstacle_pool.release(obstacle)
                 self.number_of_obstacles_removed += 1
         self._increase_speed_of_obstacles()
 
@@ -106,7 +112,11 @@ class FindFastestWay(arcade.Window):
         if goal_reached:
             self.won = True
 
-        hit_obstacles = arcade.check_for_collision_with_list(self.player, self.obstacles)
+        hit_obstacles = [
+            obstacle
+            for obstacle in arcade.check_for_collision_with_list(self.player, self.obstacles)
+            if self.obstacle_pool.is_in_use(obstacle)
+        ]
         if hit_obstacles:
             self.lost = True
 
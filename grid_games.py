@@ -0,0 +1,287 @@
+"""
+State and rules of the grid based games, independent of how they are shown.
+
+The arcade windows (`grid_based_game.py`, `schatzsuche.py`,
+`schiffe_versenken.py`) and the terminal frontend (`terminal_frontend.py`)
+show the grid of these games and forward the input of the player to them:
+`select(row, column)` for clicking on a cell and `reveal_all()` for
+cheating (if the game supports it).
+Messages for the player are passed to `notify` (by default `print`).
+
+This module does not depend on arcade.
+"""
+from grid_of_squares import GridOfSquares
+from random import choice, randbytes, randint, sample
+from typing import Callable, List, Optional, Tuple
+
+
+class ToggleGame:
+    """Not actually a game: clicking a cell toggles it between 0 and 1."""
+    title = "Grid Based Game"
+
+    def __init__(self, row_count: int = 10, column_count: int = 10, grid_length: float = 30, margin_width: float = 5,
+                 notify: Callable[[str], None] = print):
+        self.grid = GridOfSquares(row_count, column_count, grid_length, margin_width, 0)
+        self.notify = notify
+
+    def select(self, row: int, column: int):
+        cell = self.grid[row, column]
+        if cell.value == 0:
+            cell.value = 1
+        else:
+            cell.value = 0
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+# Possible tips by (sign of treasure row - row, sign of treasure column - column)
+_SCHATZSUCHE_HINTS = {
+    (0, 0): ("goal",),
+    (+1, 0): ("up",),
+    (-1, 0): ("down",),
+    (0, +1): ("right",),
+    (0, -1): ("left",),
+    (+1, +1): ("up", "right"),
+    (+1, -1): ("up", "left"),
+    (-1, +1): ("down", "right"),
+    (-1, -1): ("down", "left"),
+}
+
+
+class SchatzsucheGame:
+    """Find the gold; every search reveals a tip in which direction it is.
+    With several treasures, the tip points to the treasure nearest to the
+    searched cell.
+
+    The tips of all cells are computed up front (`hint_field`), so searching
+    cells only copies them into the grid; `reveal_rectangle` searches many
+    cells at once.
+    """
+    title = "Schatzsuche"
+
+    def __init__(self, row_count: int = 25, column_count: int = 35, grid_length: float = 30, margin_width: float = 5,
+                 notify: Callable[[str], None] = print, treasure_count: int = 1):
+        self.grid = GridOfSquares(row_count, column_count, grid_length, margin_width, "unknown")
+        self.notify = notify
+
+        # treasures are never placed on the border
+        inner_column_count = column_count - 2
+        self.treasures = [
+            (1 + position // inner_column_count, 1 + position % inner_column_count)
+            for position in sample(range((row_count - 2) * inner_column_count), treasure_count)
+        ]
+        self.goal_row, self.goal_column = self.treasures[0]
+        self.treasures_found = 0
+
+        self.number_of_search_operations = 0
+        self.hint_field = self._compute_hint_field()
+
+    def _compute_hint_field(self) -> List[str]:
+        row_count, column_count = self.grid.row_count, self.grid.column_count
+        if len(self.treasures) == 1:
+            nearest_treasure = [0] * len(self.grid.data)
+        else:
+            nearest_treasure = self.grid.nearest_seed(
+                [row * column_count + column for row, column in self.treasures]
+            )
+        # sign of the offset to each treasure, per row and per column
+        row_signs = [[_sign(treasure_row - row) for row in range(row_count)] for treasure_row, _ in self.treasures]
+        column_signs = [[_sign(treasure_column - column) for column in range(column_count)] for _, treasure_column in self.treasures]
+        # decides between the two possible tips of diagonal directions
+        random_bytes = randbytes(len(self.grid.data))
+
+        hint_field = []
+        for row in range(row_count):
+            start = row * column_count
+            hint_field.extend(
+                hints[random_byte % len(hints)]
+                for hints, random_byte in zip(
+                    (
+                        _SCHATZSUCHE_HINTS[row_signs[treasure][row], column_signs[treasure][column]]
+                        for column, treasure in enumerate(nearest_treasure[start:start + column_count])
+                    ),
+                    random_bytes[start:start + column_count],
+                )
+            )
+        return hint_field
+
+    def select(self, row: int, column: int):
+        self.reveal_rectangle(row, row + 1, column, column + 1)
+
+    def reveal_rectangle(self, row_start: int, row_stop: int, column_start: int, column_stop: int):
+        """Search all cells with row_start <= row < row_stop and column_start <= column < column_stop."""
+        row_start, row_stop = max(row_start, 0), min(row_stop, self.grid.row_count)
+        column_start, column_stop = max(column_start, 0), min(column_stop, self.grid.column_count)
+        data, hint_field, column_count = self.grid.data, self.hint_field, self.grid.column_count
+        newly_searched = 0
+        for row in range(row_start, row_stop):
+            start, stop = row * column_count + column_start, row * column_count + column_stop
+            newly_searched += data[start:stop].count("unknown")
+            # already searched cells show their tip already, so the whole row can be copied
+            data[start:stop] = hint_field[start:stop]
+        if newly_searched == 0:
+            return
+
+        treasures_found = sum(1 for row, column in self.treasures if data[row * column_count + column] == "goal")
+        newly_found = treasures_found - self.treasures_found
+        self.treasures_found = treasures_found
+        self.number_of_search_operations += newly_searched - newly_found
+        if newly_found > 0:
+            if len(self.treasures) == 1:
+                self.notify(f"Yay -- you found it with {self.number_of_search_operations} tries.")
+            elif treasures_found == len(self.treasures):
+                self.notify(f"Yay -- you found all {treasures_found} treasures with {self.number_of_search_operations} tries.")
+            else:
+                self.notify(f"Found {treasures_found} of {len(self.treasures)} treasures.")
+
+
+class Ship:
+    def __init__(self, length: int, row: int, column: int, orientation):
+        self.length = length
+        self.row = row
+        self.column = column
+        self.occupied_space = []
+        self.hits = set()
+        if orientation not in ["row", "column"]:
+            raise ValueError("Unknown orientation {}".format(orientation))
+        self.orientation = orientation
+        self._compute_occupied_space()
+
+    def _compute_occupied_space(self):
+        if self.orientation == "row":
+            for column in range(self.column, self.column + self.length):
+                self.occupied_space.append((self.row, column))
+        if self.orientation == "column":
+            for row in range(self.row, self.row + self.length):
+                self.occupied_space.append((row, self.column))
+
+    def is_at(self, row: int, column: int) -> bool:
+        return (row, column) in self.occupied_space
+
+    def hit_at(self, row: int, column: int) -> bool:
+        if not self.is_at(row, column):
+            raise ValueError(f"Ship is not at {row}, {column}, so cannot get hit.")
+        self.hits.add((row, column))
+
+    def is_sunk(self) -> bool:
+        return set(self.hits) == set(self.occupied_space)
+
+
+def _get_all_cells_in_and_around_ship(ship: Ship, grid: GridOfSquares) -> List[Tuple[int, int]]:
+    indices = grid.region_union(
+        grid.moore_neighborhood(row, col, include_center=True)
+        for row, col in ship.occupied_space
+    )
+    return grid.rows_columns_of(indices)
+
+
+class BattleshipGame:
+    """Sink all ships of the computer."""
+    title = "Battleship"
+
+    def __init__(self, row_count: int = 13, column_count: int = 13, grid_length: float = 30, margin_width: float = 5,
+                 notify: Callable[[str], None] = print):
+        # We can store/access the data in this grid using index [row, column].
+        self.grid = GridOfSquares(row_count, column_count, grid_length, margin_width, "unknown")
+        self.notify = notify
+
+        self.number_of_shots = 0
+        self.ships_to_sink_of_size = {
+            3: 4,
+            4: 3,
+            5: 2,
+            6: 2,
+        }
+        self.ships: List[Ship] = []
+        self._place_ships()
+        self.game_won = False
+
+    def _place_ships(self):
+        collissions = 0
+        for ship_size in sorted(self.ships_to_sink_of_size.keys(), reverse=True):
+            ships_to_place = self.ships_to_sink_of_size[ship_size]
+            ships_placed = 0
+            while ships_placed < ships_to_place:
+                orientation = choice(["row", "column"])
+                row = randint(0, self.grid.row_count - ship_size)
+                col = randint(0, self.grid.column_count - ship_size)
+                possible_ship = Ship(ship_size, row, col, orientation)
+                ship_is_in_collission = False
+                for row, col in _get_all_cells_in_and_around_ship(possible_ship, self.grid):
+                    if self._get_ship_at(row, col) is not None:
+                        ship_is_in_collission = True
+                        break
+                if not ship_is_in_collission:
+                    ships_placed += 1
+                    self.ships.append(possible_ship)
+                else:
+                    collissions += 1
+                    if collissions > 100000:
+                        self.notify("Ship Placement unsucessfull -- retrying")
+                        self.ships = []
+                        self._place_ships()
+
+    def _get_ship_at(self, row: int, column: int) -> Optional[Ship]:
+        for ship in self.ships:
+            if ship.is_at(row, column):
+                return ship
+        return None
+
+    def reveal_all(self):
+        self.notify("Cheeeeeter")
+        for row in range(self.grid.row_count):
+            for col in range(self.grid.column_count):
+                self._reveal_grid_cell_kind(row, col)
+
+    def _reveal_grid_cell_kind(self, row: int, column: int):
+        ship = self._get_ship_at(row, column)
+        if ship is None:
+            self.grid[row, column] = "water"
+        else:
+            if ship.is_sunk():
+                for ship_row, ship_col in ship.occupied_space:
+                    self.grid[ship_row, ship_col] = "sunk ship"
+            else:
+                self.grid[row, column] = "ship"
+
+    def _is_game_won(self):
+        ships_to_sink = sum(self.ships_to_sink_of_size.values())
+        return ships_to_sink == 0
+
+    def _print_how_much_to_sink(self):
+        ships_to_sink = sum(self.ships_to_sink_of_size.values())
+        self.notify(f"Still {ships_to_sink} ships to sink.")
+        if ships_to_sink == 0:
+            self.notify(f"You Won after {self.number_of_shots} shots.")
+        self.game_won = True
+
+    def shoot_at(self, row, column):
+        self.number_of_shots += 1
+        ship = self._get_ship_at(row, column)
+        if ship is not None:
+            ship.hit_at(row, column)
+            if ship.is_sunk():
+                self.ships_to_sink_of_size[ship.length] -= 1
+                self._print_how_much_to_sink()
+
+    def status_text_ships_to_sink(self):
+        if self._is_game_won():
+            return "Nothing to sink -- YOU WON"
+        text = "To sink: "
+        for size, number_of_ships_to_find in self.ships_to_sink_of_size.items():
+            if number_of_ships_to_find == 0:
+                draw_character = '☒'
+            else:
+                draw_character = '☐'
+            text += f"{number_of_ships_to_find} x {size * draw_character}   "
+        return text
+
+    def select(self, row: int, column: int):
+        if self.grid[row, column].value == "unknown":
+            self.shoot_at(row, column)
+            self._reveal_grid_cell_kind(row, column)
+        else:
+            self.notify(f"Grid Cell ({row}, {column}) was already known")
+        self.notify(self.status_text_ships_to_sink())
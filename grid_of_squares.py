@@ -0,0 +1,243 @@
+"""
+Grid of square cells backing the grid based games.
+
+The values of all cells are stored in one flat list `GridOfSquares.data`.
+Row 0 is the bottom row (arcade's y axis points up), so "up" means a
+larger row index.
+
+Besides accessing single cells as `GridCell`, the grid offers region
+queries (rows, columns, rectangles, neighborhoods, half planes, flood fill,
+nearest seed).
+These return flat indices into `data` -- as `range` where possible -- so no
+`GridCell` has to be created per cell and the values can be read or written
+in bulk with `values_at` and `set_values_at`.
+
+This module does not depend on arcade.
+"""
+from collections import deque
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+
+class GridCell:
+    """Grid cell "content" without margin.
+    This exposes the geometric properties of the grid cell and allows to
+    modify the value of the structure storing all values of a grid.
+    """
+    def __init__(self, position_lower_left_corner: Tuple[float, float], length: float, flat_index: int, row: int, column: int, value_container):
+        self.x_min = position_lower_left_corner[0]
+        self.y_min = position_lower_left_corner[1]
+        self.length = length
+        self.x_max = self.x_min + length
+        self.y_max = self.y_min + length
+        self.x_center = self.x_min + length / 2
+        self.y_center = self.y_min + length / 2
+        self.flat_index = flat_index
+        self.row = row
+        self.column = column
+        self._value_container = value_container
+
+    @property
+    def value(self):
+        return self._value_container[self.flat_index]
+
+    @value.setter
+    def value(self, value):
+        self._value_container[self.flat_index] = value
+
+
+class GridOfSquares:
+    def __init__(self, row_count: int, column_count: int, grid_length: float, margin_width: float, initial_value=None):
+        self.row_count = row_count
+        self.column_count = column_count
+        self.grid_length = grid_length
+        self.margin_width = margin_width
+        self.width = grid_length * column_count + margin_width * (column_count + 1)
+        self.height = grid_length * row_count + margin_width * (row_count + 1)
+        self.data = self.row_count * self.column_count * [initial_value]
+
+    def _index_from(self, row: int, column: int) -> int:
+        if row >= self.row_count:
+            raise IndexError(f"Grid has only {self.row_count} rows, row {row} was requested.")
+        if column >= self.column_count:
+            raise IndexError(f"Grid has only {self.column_count} column, column {column} was requested.")
+        index = row * self.column_count + column
+        return index
+
+    def _row_column_from(self, index: int) -> Tuple[int, int]:
+        column = index % self.column_count
+        row = index // self.column_count
+        return row, column
+
+    def __getitem__(self, key) -> GridCell:
+        if isinstance(key, int):
+            index = key
+            row, column = self._row_column_from(index)
+        elif len(key) == 2:
+            row, column = key
+            index = self._index_from(row, column)
+        else:
+            raise KeyError(f"Unable to handle index type {type(key)}.")
+
+        if index >= len(self.data):
+            raise IndexError
+        else:
+            x = self.margin_width + column * (self.grid_length + self.margin_width)
+            y = self.margin_width + row * (self.grid_length + self.margin_width)
+            return GridCell((x, y), self.grid_length, index, row, column, self.data)
+
+
+    def __setitem__(self, key, value):
+        if isinstance(key, int):
+            self.data[key] = value
+        elif len(key) == 2:
+            index = self._index_from(key[0], key[1])
+            self.data[index] = value
+        else:
+            raise KeyError
+
+    def cell_at(self, position: Tuple[float, float]) -> Optional[GridCell]:
+        x, y = position
+        column = int(x // (self.grid_length + self.margin_width))
+        row = int(y // (self.grid_length + self.margin_width))
+        if 0 <= row < self.row_count and 0 <= column < self.column_count:
+            return self[row, column]
+        else:
+            return None
+
+    def contains(self, row: int, column: int) -> bool:
+        return 0 <= row < self.row_count and 0 <= column < self.column_count
+
+    def row_column_of(self, index: int) -> Tuple[int, int]:
+        if not 0 <= index < len(self.data):
+            raise IndexError(f"Grid has only {len(self.data)} cells, index {index} was requested.")
+        return self._row_column_from(index)
+
+    def rows_columns_of(self, indices: Iterable[int]) -> List[Tuple[int, int]]:
+        return [self._row_column_from(index) for index in indices]
+
+    def values_at(self, indices: Iterable[int]) -> List:
+        data = self.data
+        return [data[index] for index in indices]
+
+    def set_values_at(self, indices: Iterable[int], value):
+        data = self.data
+        for index in indices:
+            data[index] = value
+
+    # Region queries.
+    # All of them return flat indices and clip the region to the grid.
+
+    def row(self, row: int) -> range:
+        if not 0 <= row < self.row_count:
+            raise IndexError(f"Grid has only {self.row_count} rows, row {row} was requested.")
+        start = row * self.column_count
+        return range(start, start + self.column_count)
+
+    def column(self, column: int) -> range:
+        if not 0 <= column < self.column_count:
+            raise IndexError(f"Grid has only {self.column_count} column, column {column} was requested.")
+        return range(column, len(self.data), self.column_count)
+
+    def rectangle(self, row_start: int, row_stop: int, column_start: int, column_stop: int) -> List[int]:
+        """Cells with row_start <= row < row_stop and column_start <= column < column_stop."""
+        row_start, row_stop = max(row_start, 0), min(row_stop, self.row_count)
+        column_start, column_stop = max(column_start, 0), min(column_stop, self.column_count)
+        if column_start >= column_stop:
+            return []
+        indices = []
+        for row in range(row_start, row_stop):
+            offset = row * self.column_count
+            indices.extend(range(offset + column_start, offset + column_stop))
+        return indices
+
+    def moore_neighborhood(self, row: int, column: int, radius: int = 1, include_center: bool = False) -> List[int]:
+        """Cells at most `radius` rows and columns away (including diagonals)."""
+        indices = self.rectangle(row - radius, row + radius + 1, column - radius, column + radius + 1)
+        if not include_center and self.contains(row, column):
+            indices.remove(row * self.column_count + column)
+        return indices
+
+    def von_neumann_neighborhood(self, row: int, column: int, radius: int = 1, include_center: bool = False) -> List[int]:
+        """Cells with a Manhattan distance of at most `radius`."""
+        indices = []
+        for row_delta in range(-radius, radius + 1):
+            column_radius = radius - abs(row_delta)
+            indices.extend(self.rectangle(row + row_delta, row + row_delta + 1, column - column_radius, column + column_radius + 1))
+        if not include_center and self.contains(row, column):
+            indices.remove(row * self.column_count + column)
+        return indices
+
+    def half_plane(self, row: int, column: int, direction: str) -> List[int]:
+        """Cells strictly "left", "right", "up" or "down" of the given cell."""
+        if direction == "left":
+            return self.rectangle(0, self.row_count, 0, column)
+        elif direction == "right":
+            return self.rectangle(0, self.row_count, column + 1, self.column_count)
+        elif direction == "up":
+            return self.rectangle(row + 1, self.row_count, 0, self.column_count)
+        elif direction == "down":
+            return self.rectangle(0, row, 0, self.column_count)
+        else:
+            raise ValueError(f"Unknown direction {direction}")
+
+    def region_union(self, regions: Iterable[Sequence[int]]) -> List[int]:
+        """Sorted indices contained in any of the regions, each only once."""
+        indices = set()
+        for region in regions:
+            indices.update(region)
+        return sorted(indices)
+
+    def flood_fill(self, row: int, column: int, belongs_to_region: Optional[Callable[[object], bool]] = None) -> List[int]:
+        """Cells connected to the given cell via up/down/left/right steps.
+        By default, cells belong to the region if they have the same value as
+        the start cell; pass `belongs_to_region` to decide based on the value.
+        """
+        if not self.contains(row, column):
+            raise IndexError(f"Cell ({row}, {column}) is not in the grid of {self.row_count} rows and {self.column_count} columns.")
+        start = row * self.column_count + column
+        if belongs_to_region is None:
+            start_value = self.data[start]
+            belongs_to_region = lambda value: value == start_value
+        if not belongs_to_region(self.data[start]):
+            return []
+        visited = {start}
+        queue = deque([start])
+        indices = []
+        while queue:
+            index = queue.popleft()
+            indices.append(index)
+            for neighbor in self._von_neumann_neighbors_of(index):
+                if neighbor not in visited and belongs_to_region(self.data[neighbor]):
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+        return indices
+
+    def nearest_seed(self, seeds: Sequence[int]) -> List[int]:
+        """For each cell, the position in `seeds` of the seed cell that can be
+        reached with the fewest up/down/left/right steps.
+        """
+        nearest = [-1] * len(self.data)
+        queue = deque()
+        for seed_number, index in enumerate(seeds):
+            if nearest[index] == -1:
+                nearest[index] = seed_number
+                queue.append(index)
+        while queue:
+            index = queue.popleft()
+            for neighbor in self._von_neumann_neighbors_of(index):
+                if nearest[neighbor] == -1:
+                    nearest[neighbor] = nearest[index]
+                    queue.append(neighbor)
+        return nearest
+
+    def _von_neumann_neighbors_of(self, index: int) -> List[int]:
+        neighbors = []
+        if index % self.column_count > 0:
+            neighbors.append(index - 1)
+        if index % self.column_count < self.column_count - 1:
+            neighbors.append(index + 1)
+        if index >= self.column_count:
+            neighbors.append(index - self.column_count)
+        if index + self.column_count < len(self.data):
+            neighbors.append(index + self.column_count)
+        return neighbors
@@ -11,97 +11,20 @@ If Python and Arcade are installed, this example can be run from the command lin
 python -m arcade.examples.array_backed_grid_sprites_1
 """
 import arcade
-from typing import Tuple, Optional
-from random import choice, randint
+import sys
+from grid_games import SchatzsucheGame
+from texture_grid_renderer import TextureGridRenderer
 
 
-
-class GridCell:
-    """Grid cell "content" without margin.
-    This exposes the geometric properties of the grid cell and allows to
-    modify the value of the structure storing all values of a grid.
-    """
-    def __init__(self, position_lower_left_corner: Tuple[float, float], length: float, flat_index: int, row: int, column: int, value_container):
-        self.x_min = position_lower_left_corner[0]
-        self.y_min = position_lower_left_corner[1]
-        self.length = length
-        self.x_max = self.x_min + length
-        self.y_max = self.y_min + length
-        self.x_center = self.x_min + length / 2
-        self.y_center = self.y_min + length / 2
-        self.flat_index = flat_index
-        self.row = row
-        self.column = column
-        self._value_container = value_container
-
-    @property
-    def value(self):
-        return self._value_container[self.flat_index]
-
-    @value.setter
-    def value(self, value):
-        self._value_container[self.flat_index] = value
-
-
-class GridOfSquares:
-    def __init__(self, row_count: int, column_count: int, grid_length: float, margin_width: float, initial_value=None):
-        self.row_count = row_count
-        self.column_count = column_count
-        self.grid_length = grid_length
-        self.margin_width = margin_width
-        self.width = grid_length * column_count + margin_width * (column_count + 1)
-        self.height = grid_length * row_count + margin_width * (row_count + 1)
-        self.data = self.row_count * self.column_count * [initial_value]
-
-    def _index_from(self, row: int, column: int) -> int:
-        if row >= self.row_count:
-            raise IndexError(f"Grid has only {self.row_count} rows, row {row} was requested.")
-        if column >= self.column_count:
-            raise IndexError(f"Grid has only {self.column_count} column, column {column} was requested.")
-        index = row * self.column_count + column
-        return index
-
-    def _row_column_from(self, index: int) -> Tuple[int, int]:
-        column = index % self.column_count
-        row = index // self.column_count
-        return row, column
-
-    def __getitem__(self, key) -> GridCell:
-        if isinstance(key, int):
-            index = key
-            row, column = self._row_column_from(index)
-        elif len(key) == 2:
-            row, column = key
-            index = self._index_from(row, column)
-        else:
-            raise KeyError(f"Unable to handle index type {type(key)}.")
-
-        if index >= len(self.data):
-            raise IndexError
-        else:
-            x = self.margin_width + column * (self.grid_length + self.margin_width)
-            y = self.margin_width + row * (self.grid_length + self.margin_width)
-            return GridCell((x, y), self.grid_length, index, row, column, self.data)
-
-
-    def __setitem__(self, key, value):
-        if isinstance(key, int):
-            self.data[key] = value
-        elif len(key) == 2:
-            index = self._index_from(key[0], key[1])
-            self.data[index] = value
-        else:
-            raise KeyError
-    
-    def cell_at(self, position: Tuple[float, float]) -> Optional[GridCell]:
-        x, y = position
-        column = int(x // (self.grid_length + self.margin_width))
-        row = int(y // (self.grid_length + self.margin_width))
-        if 0 <= row < self.row_count and 0 <= column < self.column_count:
-            return self[row, column]
-        else:
-            return None
-
+# Colors of the cell values if cells are too small to show tiles
+CELL_VALUE_COLORS = {
+    "unknown": arcade.color.SAND,
+    "right": arcade.color.RED,
+    "left": arcade.color.BLUE,
+    "up": arcade.color.GREEN,
+    "down": arcade.color.PURPLE,
+    "goal": arcade.color.GOLD,
+}
 
 
 
@@ -110,67 +33,87 @@ class Schatzsuche(arcade.Window):
     Main application class.
     """
 
-    def __init__(self, row_count: int, column_count: int, grid_length_px: int, margin_width_px: int, title: str):
+    def __init__(self, row_count: int, column_count: int, grid_length_px: int, margin_width_px: int, title: str,
+                 treasure_count: int = 1, use_texture_renderer: bool = False):
         """
         Set up the application.
         """
+        self.game = SchatzsucheGame(row_count, column_count, grid_length_px, margin_width_px, treasure_count=treasure_count)
         # We can store/access the data in this grid using index [row, column].
-        self.grid = GridOfSquares(row_count, column_count, grid_length_px, margin_width_px, "unknown")
+        self.grid = self.game.grid
 
         super().__init__(self.grid.width, self.grid.height, title)
 
-        self.goal_row = randint(1, row_count-2)
-        self.goal_column = randint(1, column_count-2)
-
-        self.number_of_search_operations = 0
-
         arcade.set_background_color(arcade.color.BLACK)
 
-        # We use the sprites for drawing the grid cells.
-        self.grid_sprite_list = arcade.SpriteList()
-
-        for cell in self.grid:
-            sprite = self._make_sprite("unknown", cell)
-            # show goal for debugging/learning
-            # if cell.row == self.goal_row and cell.column == self.goal_column:
-                # sprite.color = arcade.color.GREEN
-            self.grid_sprite_list.append(sprite)
-
-    def _make_sprite(self, direction: str, cell: GridCell) -> arcade.Sprite:
+        # cell where the mouse button was pressed, searching until the release
+        # reveals all cells in the rectangle between both
+        self.drag_start_cell = None
+
+        # For large boards, draw all cells with one draw call in colors instead of tiles.
+        self.texture_renderer = None
+        self.tile_textures = None
+        self.grid_sprite_list = None
+        self.shown_values = None
+        if use_texture_renderer:
+            self.texture_renderer = TextureGridRenderer(self.ctx, self.grid, CELL_VALUE_COLORS)
+        else:
+            # We use the sprites for drawing the grid cells.
+            # There is one sprite per cell; revealing a cell only swaps the
+            # texture (loaded once) of its sprite instead of creating a new one.
+            self.tile_textures = {
+                direction: arcade.load_texture(resource)
+                for direction, resource in [
+                    ("unknown", ":resources:images/tiles/sandCenter.png"),
+                    ("right", ":resources:images/tiles/signRight.png"),
+                    ("left", ":resources:images/tiles/signLeft.png"),
+                    ("goal", ":resources:images/items/gold_1.png"),
+                ]
+            }
+            self.grid_sprite_list = arcade.SpriteList()
+            self.shown_values = []  # value the sprite of the cell shows, by flat index
+
+            for cell in self.grid:
+                sprite = arcade.Sprite(center_x=cell.x_center, center_y=cell.y_center)
+                self._show_tile(sprite, "unknown")
+                # show goal for debugging/learning
+                # if cell.row == self.game.goal_row and cell.column == self.game.goal_column:
+                    # sprite.color = arcade.color.GREEN
+                self.grid_sprite_list.append(sprite)
+                self.shown_values.append("unknown")
+
+    def _show_tile(self, sprite: arcade.Sprite, direction: str):
         if direction in ["right", "up", "down"]:
-            resource = ":resources:images/tiles/signRight.png"
-        elif direction == "left":
-            resource = ":resources:images/tiles/signLeft.png"
-        elif direction == "goal":
-            resource = ":resources:images/items/gold_1.png"
-        elif direction == "unknown":
-            resource = ":resources:images/tiles/sandCenter.png"
+            sprite.texture = self.tile_textures["right"]
+        elif direction in self.tile_textures:
+            sprite.texture = self.tile_textures[direction]
         else:
             raise ValueError(f"Unknown direction {direction}")
 
-        new_sprite = arcade.Sprite(
-            resource,
-            center_x=cell.x_center,
-            center_y=cell.y_center,
-        )
-
         if direction == "up":
-            new_sprite.angle = 90
+            sprite.angle = 90
         elif direction == "down":
-            new_sprite.angle = 270
-
-        new_sprite.width = cell.length
-        new_sprite.height = cell.length
+            sprite.angle = 270
+        else:
+            sprite.angle = 0
 
-        return new_sprite
+        # setting the texture resets the size to the one of the texture
+        sprite.width = self.grid.grid_length
+        sprite.height = self.grid.grid_length
 
     def resync_grid_with_sprites(self):
-        for cell in self.grid:
-            if cell.value == "unknown":
-                continue
-            else:
-                new_sprite = self._make_sprite(cell.value, cell)
-                self.grid_sprite_list[cell.flat_index] = new_sprite
+        if self.texture_renderer is not None:
+            self.texture_renderer.update()
+            return
+        changed_indices = [
+            index
+            for index, (value, shown_value) in enumerate(zip(self.grid.data, self.shown_values))
+            if value != shown_value
+        ]
+        for index in changed_indices:
+            value = self.grid.data[index]
+            self._show_tile(self.grid_sprite_list[index], value)
+            self.shown_values[index] = value
 
     def on_draw(self):
         """
@@ -180,7 +123,10 @@ class Schatzsuche(arcade.Window):
         # This command has to happen before we start drawing
         arcade.start_render()
 
-        self.grid_sprite_list.draw()
+        if self.texture_renderer is not None:
+            self.texture_renderer.draw()
+        else:
+            self.grid_sprite_list.draw()
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.Q:
@@ -191,31 +137,34 @@ class Schatzsuche(arcade.Window):
         Called when the user presses a mouse button.
         """
 
-        cell = self.grid.cell_at((x, y))
-        if cell is not None:
-            if cell.value == "unknown":
-                if self.goal_row == cell.row and self.goal_column == cell.column:
-                    cell.value = "goal"
-                    print(f"Yay -- you found it with {self.number_of_search_operations} tries.")
-                else:
-                    self.number_of_search_operations += 1
-                    possible_directions = []
-                    if cell.row < self.goal_row:
-                        possible_directions.append("up")
-                    elif cell.row > self.goal_row:
-                        possible_directions.append("down")
-                    if cell.column < self.goal_column:
-                        possible_directions.append("right")
-                    elif cell.column > self.goal_column:
-                        possible_directions.append("left")
-
-                    cell.value = choice(possible_directions)
+        self.drag_start_cell = self.grid.cell_at((x, y))
+
+    def on_mouse_release(self, x, y, button, modifiers):
+        """
+        Called when the user releases a mouse button.
+        """
+
+        start = self.drag_start_cell
+        end = self.grid.cell_at((x, y))
+        self.drag_start_cell = None
+        if start is None or end is None:
+            return
+        if start.flat_index == end.flat_index:
+            self.game.select(end.row, end.column)
+        else:
+            self.game.reveal_rectangle(
+                min(start.row, end.row), max(start.row, end.row) + 1,
+                min(start.column, end.column), max(start.column, end.column) + 1,
+            )
 
         self.resync_grid_with_sprites()
 
 
 def main():
-    game = Schatzsuche(25, 35, 30, 5, "Schatzsuche")
+    if "--huge" in sys.argv:
+        game = Schatzsuche(300, 400, 3, 0, "Schatzsuche", treasure_count=5, use_texture_renderer=True)
+    else:
+        game = Schatzsuche(25, 35, 30, 5, "Schatzsuche")
     arcade.run()
 
 
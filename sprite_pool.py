@@ -0,0 +1,52 @@
+"""
+Reusable pool of sprites.
+
+Instead of destroying sprites (remove_from_sprite_lists) and creating new
+ones later, sprites are released to the pool (hidden) and acquired again
+(shown) when needed.
+This avoids allocating sprites and re-uploading them to the GPU during the
+game.
+"""
+import arcade
+from typing import Callable, List, Set
+
+
+class SpritePool:
+    """Pool of sprites that all live in one sprite list.
+    Sprites are only ever created by `factory` if no released sprite is
+    available; they are never removed from `sprite_list` but hidden instead.
+    """
+    def __init__(self, sprite_list: arcade.SpriteList, factory: Callable[[], arcade.Sprite]):
+        self.sprite_list = sprite_list
+        self._factory = factory
+        self._released: List[arcade.Sprite] = []
+        self._in_use: Set[arcade.Sprite] = set()
+
+    def acquire(self) -> arcade.Sprite:
+        if self._released:
+            sprite = self._released.pop()
+            sprite.visible = True
+        else:
+            sprite = self._factory()
+            self.sprite_list.append(sprite)
+        self._in_use.add(sprite)
+        return sprite
+
+    def release(self, sprite: arcade.Sprite):
+        if sprite not in self._in_use:
+            raise ValueError("Sprite was not acquired from this pool.")
+        self._in_use.remove(sprite)
+        sprite.visible = False
+        self._released.append(sprite)
+
+    def release_all(self):
+        for sprite in list(self._in_use):
+            self.release(sprite)
+
+    def is_in_use(self, sprite: arcade.Sprite) -> bool:
+        return sprite in self._in_use
+
+    @property
+    def in_use(self) -> List[arcade.Sprite]:
+        """Sprites currently acquired (i.e. visible), in sprite list order."""
+        return [sprite for sprite in self.sprite_list if sprite in self._in_use]
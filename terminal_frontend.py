@@ -0,0 +1,207 @@
+"""
+Play the grid based games in a terminal -- no display or OpenGL needed.
+
+    python terminal_frontend.py [grid|schatzsuche|schiffe_versenken]
+
+Move the cursor with the arrow keys (or h/j/k/l) and select a cell with
+Space/Enter (or click it with the mouse, if the terminal supports it).
+In Schatzsuche, mark a corner with `M` to search the whole rectangle
+between it and the cursor on the next selection.
+Use `C` to cheat in battleship and `Q` to quit.
+
+The games are the same as in the arcade windows (see `grid_games.py`);
+this module does not import arcade.
+Only cells whose value changed are redrawn.
+If the board does not fit into the terminal, only the part around the
+cursor is shown and it scrolls along with the cursor.
+"""
+import curses
+import locale
+import sys
+from grid_games import BattleshipGame, SchatzsucheGame, ToggleGame
+
+
+# Per game: game class and how to show the values of its cells (character, color)
+GAMES = {
+    "grid": (ToggleGame, {
+        0: (".", curses.COLOR_WHITE),
+        1: ("#", curses.COLOR_GREEN),
+    }),
+    "schatzsuche": (SchatzsucheGame, {
+        "unknown": (".", curses.COLOR_YELLOW),
+        "right": (">", curses.COLOR_WHITE),
+        "left": ("<", curses.COLOR_WHITE),
+        "up": ("^", curses.COLOR_WHITE),
+        "down": ("v", curses.COLOR_WHITE),
+        "goal": ("$", curses.COLOR_YELLOW),
+    }),
+    "schiffe_versenken": (BattleshipGame, {
+        "unknown": (".", curses.COLOR_WHITE),
+        "ship": ("#", curses.COLOR_RED),
+        "sunk ship": ("X", curses.COLOR_MAGENTA),
+        "water": ("~", curses.COLOR_BLUE),
+    }),
+}
+
+# Each cell takes this many characters in a line (1 if the board is too wide otherwise)
+CELL_WIDTH = 2
+
+
+class TerminalFrontend:
+    def __init__(self, screen, game_class, glyphs):
+        self.screen = screen
+        self.game = game_class(notify=self.show_message)
+        self.grid = self.game.grid
+        self.glyphs = glyphs
+        self.messages = []  # messages since the last input of the player
+        self.cursor_row = self.grid.row_count // 2
+        self.cursor_column = self.grid.column_count // 2
+        self.marked_corner = None
+
+        # grid row shown in the bottom line and grid column shown in the left column
+        self.bottom_row = 0
+        self.left_column = 0
+        self._layout()
+
+        curses.curs_set(1)
+        curses.mousemask(curses.BUTTON1_CLICKED | curses.BUTTON1_PRESSED)
+        self.color_pair_of_value = {}
+        if curses.has_colors():
+            curses.start_color()
+            for pair_number, (value, (_, color)) in enumerate(glyphs.items(), start=1):
+                curses.init_pair(pair_number, color, curses.COLOR_BLACK)
+                self.color_pair_of_value[value] = curses.color_pair(pair_number)
+
+        self.shown_values = [None] * len(self.grid.data)  # forces the first draw of all cells
+        self.shown_message = None
+        self._scroll_to_cursor()
+
+    def _layout(self):
+        """Fit the shown part of the board to the current size of the terminal."""
+        height, width = self.screen.getmaxyx()
+        # the last line is for the status
+        if height < 2:
+            raise SystemExit("Terminal too small, need at least 2 lines.")
+        self.cell_width = CELL_WIDTH if self.grid.column_count * CELL_WIDTH <= width else 1
+        self.visible_row_count = min(self.grid.row_count, height - 1)
+        self.visible_column_count = min(self.grid.column_count, width // self.cell_width)
+        # keep the shown part inside of the board
+        self.bottom_row = min(self.bottom_row, self.grid.row_count - self.visible_row_count)
+        self.left_column = min(self.left_column, self.grid.column_count - self.visible_column_count)
+
+    def _resize(self):
+        self._layout()
+        self.screen.clear()
+        # force drawing everything at the new positions
+        self.shown_values = [None] * len(self.grid.data)
+        self.shown_message = None
+        self._scroll_to_cursor()
+
+    def show_message(self, message: str):
+        self.messages.append(message)
+
+    def _screen_position(self, row: int, column: int):
+        # row 0 is the bottom row, as in the arcade windows
+        return self.visible_row_count - 1 - (row - self.bottom_row), (column - self.left_column) * self.cell_width
+
+    def _cell_at_screen_position(self, y: int, x: int):
+        if not (0 <= y < self.visible_row_count and 0 <= x < self.visible_column_count * self.cell_width):
+            return None
+        row = self.bottom_row + self.visible_row_count - 1 - y
+        column = self.left_column + x // self.cell_width
+        if self.grid.contains(row, column):
+            return row, column
+        return None
+
+    def _scroll_to_cursor(self):
+        bottom_row = min(max(self.bottom_row, self.cursor_row - self.visible_row_count + 1), self.cursor_row)
+        left_column = min(max(self.left_column, self.cursor_column - self.visible_column_count + 1), self.cursor_column)
+        if (bottom_row, left_column) != (self.bottom_row, self.left_column):
+            self.bottom_row, self.left_column = bottom_row, left_column
+            # all visible cells are at a new position on the screen
+            self.shown_values = [None] * len(self.grid.data)
+
+    def redraw(self):
+        column_count = self.grid.column_count
+        for row in range(self.bottom_row, self.bottom_row + self.visible_row_count):
+            for column in range(self.left_column, self.left_column + self.visible_column_count):
+                index = row * column_count + column
+                value = self.grid.data[index]
+                if value != self.shown_values[index]:
+                    character, _ = self.glyphs[value]
+                    y, x = self._screen_position(row, column)
+                    self.screen.addstr(y, x, character, self.color_pair_of_value.get(value, 0))
+                    self.shown_values[index] = value
+        message = " ".join(self.messages)
+        if message != self.shown_message:
+            self.screen.move(self.visible_row_count, 0)
+            self.screen.clrtoeol()
+            self.screen.addstr(self.visible_row_count, 0, message[:self.screen.getmaxyx()[1] - 1])
+            self.shown_message = message
+        self.screen.move(*self._screen_position(self.cursor_row, self.cursor_column))
+        self.screen.refresh()
+
+    def _move_cursor(self, row_delta: int, column_delta: int):
+        row = self.cursor_row + row_delta
+        column = self.cursor_column + column_delta
+        if self.grid.contains(row, column):
+            self.cursor_row, self.cursor_column = row, column
+            self._scroll_to_cursor()
+
+    def handle_key(self, key):
+        if key in (ord("q"), ord("Q")):
+            raise SystemExit()
+        elif key in (curses.KEY_UP, ord("k")):
+            self._move_cursor(+1, 0)
+        elif key in (curses.KEY_DOWN, ord("j")):
+            self._move_cursor(-1, 0)
+        elif key in (curses.KEY_LEFT, ord("h")):
+            self._move_cursor(0, -1)
+        elif key in (curses.KEY_RIGHT, ord("l")):
+            self._move_cursor(0, +1)
+        elif key in (ord(" "), ord("\n"), curses.KEY_ENTER):
+            if self.marked_corner is not None:
+                (row, column), self.marked_corner = self.marked_corner, None
+                self.game.reveal_rectangle(
+                    min(row, self.cursor_row), max(row, self.cursor_row) + 1,
+                    min(column, self.cursor_column), max(column, self.cursor_column) + 1,
+                )
+            else:
+                self.game.select(self.cursor_row, self.cursor_column)
+        elif key in (ord("m"), ord("M")) and hasattr(self.game, "reveal_rectangle"):
+            self.marked_corner = (self.cursor_row, self.cursor_column)
+            self.show_message("Corner marked, select the opposite corner.")
+        elif key in (ord("c"), ord("C")) and hasattr(self.game, "reveal_all"):
+            self.game.reveal_all()
+        elif key == curses.KEY_RESIZE:
+            self._resize()
+        elif key == curses.KEY_MOUSE:
+            try:
+                _, x, y, _, _ = curses.getmouse()
+            except curses.error:
+                return
+            cell = self._cell_at_screen_position(y, x)
+            if cell is not None:
+                self.cursor_row, self.cursor_column = cell
+                self.game.select(*cell)
+
+    def run(self):
+        while True:
+            self.redraw()
+            key = self.screen.getch()
+            if key != curses.KEY_RESIZE:
+                self.messages = []
+            self.handle_key(key)
+
+
+def main():
+    name = sys.argv[1] if len(sys.argv) > 1 else "grid"
+    if name not in GAMES:
+        raise SystemExit(f"Unknown game {name}, choose one of {', '.join(GAMES)}.")
+    game_class, glyphs = GAMES[name]
+    locale.setlocale(locale.LC_ALL, "")
+    curses.wrapper(lambda screen: TerminalFrontend(screen, game_class, glyphs).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Draw a whole GridOfSquares with a single draw call.
+
+Instead of one sprite per cell, the values of all cells are uploaded as
+palette indices into a small texture (one texel per cell) and the board is
+drawn as one quad; the fragment shader looks up the cell under each pixel
+and its color in the palette.
+Only texels of cells that changed since the last `update` are uploaded.
+
+This can be used instead of a sprite list with one `SpriteSolidColor` per
+cell (see `grid_based_game.py`, `schiffe_versenken.py`).
+
+To check that both renderers produce the same image, run
+
+    ARCADE_HEADLESS=1 LIBGL_ALWAYS_SOFTWARE=1 python texture_grid_renderer.py
+
+which renders random grids offscreen (e.g. with Mesa llvmpipe) with both
+renderers and compares the images pixel by pixel -- after changing all
+cells as well as after changing only a few of them, and with a pixel ratio
+of 1 as well as 2 (as on HiDPI displays).
+"""
+import arcade
+from arcade.gl import geometry
+from grid_of_squares import GridOfSquares
+from typing import Dict, List, Tuple
+
+
+VERTEX_SHADER = """
+#version 330
+
+in vec2 in_vert;
+
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+// palette index of each cell, texel (column, row)
+uniform usampler2D cell_values;
+// one RGBA color per palette index
+uniform sampler2D palette;
+// lower left corner of the grid in window pixels
+uniform vec2 origin;
+uniform float cell_length;
+uniform float margin_width;
+// framebuffer pixels per window pixel (e.g. 2 on HiDPI displays)
+uniform float pixel_ratio;
+
+out vec4 fragment_color;
+
+void main() {
+    float pitch = cell_length + margin_width;
+    vec2 position = gl_FragCoord.xy / pixel_ratio - origin - vec2(margin_width);
+    ivec2 cell = ivec2(floor(position / pitch));
+    vec2 position_in_cell = position - vec2(cell) * pitch;
+    if (any(lessThan(cell, ivec2(0)))
+            || any(greaterThanEqual(cell, textureSize(cell_values, 0)))
+            || any(greaterThanEqual(position_in_cell, vec2(cell_length)))) {
+        // margin or outside of the grid: keep the background
+        discard;
+    }
+    uint palette_index = texelFetch(cell_values, cell, 0).r;
+    fragment_color = texelFetch(palette, ivec2(int(palette_index), 0), 0);
+}
+"""
+
+
+class TextureGridRenderer:
+    """Draws the cells of `grid` in the colors given by `palette` (value -> color).
+    Call `update` after the values of the grid changed and `draw` in on_draw.
+    Positions and sizes are in window pixels; they are scaled by the pixel
+    ratio of the window (or `pixel_ratio`, if set) like the sprites are.
+    """
+    def __init__(self, ctx, grid: GridOfSquares, palette: Dict, origin: Tuple[float, float] = (0, 0)):
+        if len(palette) > 256:
+            raise ValueError(f"At most 256 palette entries supported, got {len(palette)}.")
+        self.grid = grid
+        self.pixel_ratio = None  # None: use the pixel ratio of the window
+        self._ctx = ctx
+        self._palette_index_of_value = {value: index for index, value in enumerate(palette)}
+
+        palette_data = bytearray()
+        for color in palette.values():
+            palette_data.extend(tuple(color) + (255,) * (4 - len(color)))
+        self._palette_texture = ctx.texture((len(palette), 1), components=4, dtype="f1", data=bytes(palette_data))
+
+        self._uploaded = self._palette_indices()
+        self._cell_texture = ctx.texture(
+            (grid.column_count, grid.row_count), components=1, dtype="u1", data=bytes(self._uploaded)
+        )
+
+        self._program = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+        self._program["cell_values"] = 0
+        self._program["palette"] = 1
+        self._program["origin"] = origin
+        self._program["cell_length"] = grid.grid_length
+        self._program["margin_width"] = grid.margin_width
+        self._quad = geometry.quad_2d_fs()
+
+    def _palette_indices(self) -> List[int]:
+        try:
+            return [self._palette_index_of_value[value] for value in self.grid.data]
+        except KeyError as error:
+            raise ValueError(f"Unexpected cell value {error.args[0]}")
+
+    def update(self):
+        """Upload the cells that changed since the last update."""
+        new = self._palette_indices()
+        column_count = self.grid.column_count
+        changed_rows = []
+        for row in range(self.grid.row_count):
+            start = row * column_count
+            if new[start:start + column_count] != self._uploaded[start:start + column_count]:
+                changed_rows.append(row)
+
+        if len(changed_rows) > self.grid.row_count // 2:
+            self._cell_texture.write(bytes(new))
+        else:
+            for row in changed_rows:
+                start = row * column_count
+                changed_columns = [
+                    column for column in range(column_count)
+                    if new[start + column] != self._uploaded[start + column]
+                ]
+                first, last = changed_columns[0], changed_columns[-1]
+                self._cell_texture.write(
+                    bytes(new[start + first:start + last + 1]),
+                    viewport=(first, row, last - first + 1, 1),
+                )
+        self._uploaded = new
+
+    def draw(self):
+        if self.pixel_ratio is not None:
+            self._program["pixel_ratio"] = self.pixel_ratio
+        else:
+            self._program["pixel_ratio"] = self._ctx.window.get_pixel_ratio()
+        self._cell_texture.use(0)
+        self._palette_texture.use(1)
+        self._quad.render(self._program)
+
+
+def main():
+    """Compare the texture renderer with the sprite renderer pixel by pixel."""
+    from random import choice, randint, randrange
+
+    palette = {
+        "unknown": arcade.color.WHITE,
+        "ship": arcade.color.BROWN,
+        "sunk ship": arcade.color.BLACK,
+        "water": arcade.color.BLUE,
+    }
+    grid = GridOfSquares(13, 17, 30, 5, "unknown")
+    window = arcade.Window(int(grid.width), int(grid.height), "Texture Grid Renderer")
+    arcade.set_background_color(arcade.color.GRAY)
+
+    sprite_list = arcade.SpriteList()
+    for cell in grid:
+        sprite = arcade.SpriteSolidColor(cell.length, cell.length, arcade.color.WHITE)
+        sprite.center_x = cell.x_center
+        sprite.center_y = cell.y_center
+        sprite_list.append(sprite)
+    renderer = TextureGridRenderer(window.ctx, grid, palette)
+
+    # A framebuffer twice the size of the window, drawn to with the projection
+    # of the window, scales everything like a HiDPI display (pixel ratio 2).
+    hidpi_framebuffer = window.ctx.framebuffer(
+        color_attachments=[window.ctx.texture((2 * window.width, 2 * window.height), components=4)]
+    )
+
+    def draw_images(draw):
+        """Images drawn with pixel ratio 1 (the window) and 2 (the framebuffer)."""
+        arcade.start_render()
+        renderer.pixel_ratio = None
+        draw()
+        window_image = arcade.get_image(0, 0, window.width, window.height).tobytes()
+        with hidpi_framebuffer.activate():
+            hidpi_framebuffer.clear(arcade.color.GRAY)
+            renderer.pixel_ratio = 2
+            draw()
+        return window_image, hidpi_framebuffer.read(components=4)
+
+    # The first rounds change all cells (uploading the whole texture), the
+    # others only a few cells (uploading only the changed parts of rows).
+    for round_number in range(23):
+        if round_number < 3:
+            changed_indices = range(len(grid.data))
+        else:
+            changed_indices = [randrange(len(grid.data)) for _ in range(randint(1, 4))]
+        for index in changed_indices:
+            grid[index] = choice(list(palette))
+        for index, value in enumerate(grid.data):
+            sprite_list[index].color = palette[value]
+        renderer.update()
+
+        if draw_images(sprite_list.draw) != draw_images(renderer.draw):
+            raise SystemExit("Texture renderer and sprite renderer differ.")
+
+    print("Texture renderer and sprite renderer produce the same image.")
+
+
+if __name__ == "__main__":
+    main()